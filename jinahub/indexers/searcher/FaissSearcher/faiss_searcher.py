@@ -2,15 +2,17 @@ __copyright__ = "Copyright (c) 2021 Jina AI Limited. All rights reserved."
 __license__ = "Apache-2.0"
 
 import gzip
+import itertools
 import os
 import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable, Dict, Generator, Iterable, List, Optional, Tuple
 
 import faiss
 import numpy as np
 from jina import Document, DocumentArray, Executor, requests
-from jina.helper import batch_iterator
 from jina_commons import get_logger
 from jina_commons.indexers.dump import import_vectors
 
@@ -50,6 +52,10 @@ class FaissSearcher(Executor):
     :param nprobe: Number of clusters to consider at search time.
     :param is_distance: Boolean flag that describes if distance metric need to be
         reinterpreted as similarities.
+    :param blas_threshold: the batch size from which faiss switches the
+        brute-force (``Flat``) distance computation to its BLAS path. Lower
+        it to force BLAS for small query batches. Sets the faiss-wide
+        ``distance_compute_blas_threshold`` (default 20) when provided.
     :param make_direct_map: Boolean flag that describes if direct map has to be
         computed after building the index. Useful if you need to call `fill_embedding`
         endpoint and reconstruct vectors by id
@@ -88,6 +94,8 @@ class FaissSearcher(Executor):
         is_distance: bool = False,
         default_top_k: int = 5,
         on_gpu: bool = False,
+        blas_threshold: Optional[int] = None,
+        make_direct_map: bool = False,
         *args,
         **kwargs,
     ):
@@ -102,15 +110,24 @@ class FaissSearcher(Executor):
         self.normalize = normalize
         self.nprobe = nprobe
         self.on_gpu = on_gpu
+        self.make_direct_map = make_direct_map
 
         self.default_top_k = default_top_k
         self.default_traversal_paths = default_traversal_paths
         self.is_distance = is_distance
 
-        self._doc_ids = []
+        if blas_threshold is not None:
+            faiss.cvar.distance_compute_blas_threshold = blas_threshold
+
+        self._doc_ids = np.empty(0, dtype=object)
         self._doc_id_to_offset = {}
-        self._is_deleted = []
+        self._is_deleted = np.zeros(0, dtype=bool)
+        self._deleted_count = 0
         self._prefetch_data = []
+        self._staging = None
+        self._dists_buf = None
+        self._ids_buf = None
+        self._gpu_resources = None
 
         self.logger = get_logger(self)
         is_loaded = False
@@ -142,29 +159,49 @@ class FaissSearcher(Executor):
             return
 
         if iterator is not None:
-            iterator = self._iterate_vectors_and_save_ids(iterator)
-            self._prefetch_data = []
-            if self.prefetch_size and self.prefetch_size > 0:
-                for _ in range(prefetch_size):
-                    try:
-                        self._prefetch_data.append(next(iterator))
-                    except StopIteration:
-                        break
-            else:
-                self._prefetch_data = list(iterator)
+            # peek the first vector to infer the vector dimension and dtype
+            try:
+                first_id, first_vector = next(iter(iterator))
+            except StopIteration:
+                self.logger.warning('The dump data is empty')
+                return
 
-            self.num_dim = self._prefetch_data[0].shape[0]
-            self.dtype = self._prefetch_data[0].dtype
-            self.index = self._build_index(iterator)
+            first_vector = np.frombuffer(first_vector)
+            self.num_dim = first_vector.shape[0]
+            self.dtype = first_vector.dtype
+
+            iterator = itertools.chain([(first_id, first_vector)], iterator)
+            self._prefetch_data = []
+            self.index = self._build_index(
+                self._iterate_vectors_and_save_ids(iterator)
+            )
 
     def _iterate_vectors_and_save_ids(self, iterator):
-        for position, id_vector in enumerate(iterator):
-            id_ = id_vector[0]
-            vector = id_vector[1]
-            self._doc_ids.append(id_)
-            self._doc_id_to_offset[id_] = position
-            self._is_deleted.append(0)
-            yield np.frombuffer(vector)
+        """Iterate over ``(id, vector)`` pairs in chunks of ``prefetch_size``.
+
+        The raw vector buffers of each chunk are decoded with a single
+        ``np.frombuffer`` call rather than one numpy wrapper per vector.
+        The doc ids are recorded in bulk as a side effect.
+        """
+        chunk_size = (
+            self.prefetch_size
+            if self.prefetch_size and self.prefetch_size > 0
+            else None
+        )
+        while True:
+            ids_chunk = []
+            buffers = []
+            for id_, vector in itertools.islice(iterator, chunk_size):
+                ids_chunk.append(id_)
+                buffers.append(vector)
+            if not ids_chunk:
+                return
+
+            self._add_doc_ids(ids_chunk)
+
+            yield np.frombuffer(b''.join(buffers), dtype=self.dtype).reshape(
+                len(ids_chunk), self.num_dim
+            )
 
     def device(self):
         """
@@ -178,7 +215,15 @@ class FaissSearcher(Executor):
         """
 
         # For now, consider only one GPU, do not distribute the index
-        return faiss.StandardGpuResources() if self.on_gpu else None
+        if not self.on_gpu:
+            return None
+
+        # spinning up the gpu resources is expensive (workspace allocation
+        # happens on creation), so keep a single instance per executor and
+        # reuse it for every cpu->gpu clone
+        if self._gpu_resources is None:
+            self._gpu_resources = faiss.StandardGpuResources()
+        return self._gpu_resources
 
     def to_device(self, index, *args, **kwargs):
         """Load the model to device."""
@@ -212,11 +257,27 @@ class FaissSearcher(Executor):
 
         self._faiss_index = self.to_device(index)
         self._faiss_index.nprobe = self.nprobe
+        self._maybe_make_direct_map()
+
+    def _maybe_make_direct_map(self):
+        """Build (and maintain) the offset->vector direct map on IVF-like
+        indexes, so ``reconstruct`` is O(1) instead of scanning the
+        inverted lists
+        """
+        if not self.make_direct_map:
+            return
+        try:
+            index_ivf = faiss.extract_index_ivf(self._faiss_index)
+        except RuntimeError:
+            # not IVF-based, reconstruct works without a direct map
+            return
+        index_ivf.make_direct_map()
 
     def _build_index(self, vecs_iter: Iterable['np.ndarray']):
         """Build an advanced index structure from a numpy array.
 
-        :param vecs_iter: iterator of numpy array containing the vectors to index
+        :param vecs_iter: iterator of 2D numpy arrays containing the
+            batches of vectors to index
         """
 
         self._init_faiss_index(self.num_dim, trained_index_file=self.trained_index_file)
@@ -224,35 +285,12 @@ class FaissSearcher(Executor):
         if self.requires_training and (not self._faiss_index.is_trained):
             self.logger.info('Taking indexed data as training points')
             if self.max_num_training_points is None:
-                self._prefetch_data.extend(list(vecs_iter))
+                self._prefetch_data.extend(vecs_iter)
+                train_data = np.concatenate(self._prefetch_data).astype(np.float32)
             else:
-                self.logger.info('Taking indexed data as training points')
-                while (
-                    self.max_num_training_points
-                    and len(self._prefetch_data) < self.max_num_training_points
-                ):
-                    try:
-                        self._prefetch_data.append(next(vecs_iter))
-                    except Exception as _:  # noqa: F841
-                        break
-
-            train_data = np.stack(self._prefetch_data)
-            train_data = train_data.astype(np.float32)
-
-            if (
-                self.max_num_training_points
-                and self.max_num_training_points < train_data.shape[0]
-            ):
-                self.logger.warning(
-                    f'From train_data with num_points {train_data.shape[0]}, '
-                    f'sample {self.max_num_training_points} points'
-                )
-                random_indices = np.random.choice(
-                    train_data.shape[0],
-                    size=min(self.max_num_training_points, train_data.shape[0]),
-                    replace=False,
-                )
-                train_data = train_data[random_indices, :]
+                spool = tempfile.TemporaryFile()
+                train_data = self._sample_training_points(vecs_iter, spool)
+                vecs_iter = self._replay_spooled_vectors(spool)
 
             self.logger.info('Training Faiss indexer...')
 
@@ -273,26 +311,120 @@ class FaissSearcher(Executor):
         self.logger.info('Building the Faiss index...')
         self._build_partial_index(vecs_iter)
 
-    def _build_partial_index(self, vecs_iter: Iterable['np.ndarray']):
-        if len(self._prefetch_data) > 0:
-            vecs = np.stack(self._prefetch_data).astype(np.float32)
-            self._index(vecs)
-            self._prefetch_data.clear()
+    def _sample_training_points(self, vecs_iter, spool) -> 'np.ndarray':
+        """Draw a uniform sample of ``max_num_training_points`` rows from
+        the vector stream with reservoir sampling (Algorithm R, applied
+        per chunk).
 
-        for batch_data in batch_iterator(vecs_iter, self.prefetch_size):
-            batch_data = list(batch_data)
-            if len(batch_data) == 0:
-                break
-            vecs = np.stack(batch_data).astype(np.float32)
+        Unlike sampling from the first chunks only, every vector of the
+        dump has the same chance of being selected. The consumed chunks
+        are spooled to ``spool`` (a temporary file) rather than RAM, so
+        capping the training points also caps the memory footprint; they
+        are replayed for indexing by ``_replay_spooled_vectors``.
+        """
+        sample_size = self.max_num_training_points
+        reservoir = np.empty((sample_size, self.num_dim), dtype=np.float32)
+        num_seen = 0
+
+        for chunk in vecs_iter:
+            spool.write(chunk.tobytes())
+            num_rows = chunk.shape[0]
+            start = 0
+            if num_seen < sample_size:
+                take = min(sample_size - num_seen, num_rows)
+                reservoir[num_seen : num_seen + take] = chunk[:take]
+                num_seen += take
+                start = take
+            if start < num_rows:
+                # vectorized replacement step: row with global index i
+                # replaces a reservoir slot with probability size/(i+1)
+                num_rest = num_rows - start
+                bounds = np.arange(num_seen + 1, num_seen + num_rest + 1)
+                slots = (np.random.random(num_rest) * bounds).astype(np.int64)
+                hits = np.flatnonzero(slots < sample_size)
+                reservoir[slots[hits]] = chunk[start + hits]
+                num_seen += num_rest
+
+        return reservoir[: min(num_seen, sample_size)]
+
+    def _replay_spooled_vectors(self, spool):
+        """Re-stream the spooled vector chunks in ``prefetch_size``
+        batches and delete the spool file when exhausted
+        """
+        batch_rows = (
+            self.prefetch_size
+            if self.prefetch_size and self.prefetch_size > 0
+            else 512
+        )
+        row_bytes = self.num_dim * np.dtype(self.dtype).itemsize
+        spool.seek(0)
+        try:
+            while True:
+                data = spool.read(batch_rows * row_bytes)
+                if not data:
+                    return
+                yield np.frombuffer(data, dtype=self.dtype).reshape(
+                    -1, self.num_dim
+                )
+        finally:
+            spool.close()
+
+    def _build_partial_index(self, vecs_iter: Iterable['np.ndarray']):
+        for vecs in self._prefetch_data:
             self._index(vecs)
+        self._prefetch_data.clear()
+
+        # double-buffer: decode the next chunk in a worker thread while
+        # faiss adds the current one (faiss releases the GIL during add)
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_chunk = prefetcher.submit(next, vecs_iter, None)
+            while True:
+                vecs = next_chunk.result()
+                if vecs is None:
+                    break
+                next_chunk = prefetcher.submit(next, vecs_iter, None)
+                self._index(vecs)
 
         return
 
+    def _staging_batch(self, num_rows: int) -> 'np.ndarray':
+        if self._staging is None or self._staging.shape[0] < num_rows:
+            capacity = max(num_rows, self.prefetch_size or 0)
+            # over-allocate and offset so the rows start 64-byte aligned,
+            # letting faiss' SIMD kernels use aligned loads
+            num_bytes = capacity * self.num_dim * 4
+            raw = np.empty(num_bytes + 64, dtype=np.uint8)
+            offset = (-raw.ctypes.data) % 64
+            self._staging = (
+                raw[offset : offset + num_bytes]
+                .view(np.float32)
+                .reshape(capacity, self.num_dim)
+            )
+        return self._staging[:num_rows]
+
+    def _as_float32_batch(self, vecs: 'np.ndarray') -> 'np.ndarray':
+        """Copy ``vecs`` into a reusable float32 staging buffer.
+
+        Avoids allocating (and normalizing in) a fresh float32 array for
+        every batch handed over to Faiss. The returned view is only valid
+        until the next call.
+        """
+        batch = self._staging_batch(vecs.shape[0])
+        np.copyto(batch, vecs)
+        return batch
+
     def _index(self, vecs: 'np.ndarray'):
         if self.normalize:
-            from faiss import normalize_L2
-
-            normalize_L2(vecs)
+            # fuse the float32 cast with the normalization: one pass over
+            # the source rows that writes the normalized result straight
+            # into the staging buffer
+            batch = self._staging_batch(vecs.shape[0])
+            norms = np.sqrt(np.einsum('ij,ij->i', vecs, vecs))
+            norms[norms == 0] = 1.0
+            np.divide(vecs, norms[:, None], out=batch)
+            vecs = batch
+        else:
+            vecs = self._as_float32_batch(vecs)
         self._faiss_index.add(vecs)
 
     @requests(on='/search')
@@ -323,42 +455,79 @@ class FaissSearcher(Executor):
 
         query_docs = docs.traverse_flat(traversal_paths)
 
-        vecs = np.array(query_docs.get_attributes('embedding'), dtype=np.float32)
+        # read the embeddings as one stacked block instead of collecting a
+        # Python list of per-doc arrays
+        embeddings = getattr(query_docs, 'embeddings', None)
+        if embeddings is None:
+            embeddings = np.stack(query_docs.get_attributes('embedding'))
+        vecs = self._as_float32_batch(embeddings)
 
         if self.normalize:
-            from faiss import normalize_L2
-
-            normalize_L2(vecs)
+            faiss.normalize_L2(vecs)
+
+        dists, ids = self._faiss_search(vecs, expand_topk)
+
+        scores = self._compute_scores(dists)
+
+        # filter out the padded (-1) and soft-deleted results in one
+        # vectorized pass instead of one Python check per hit
+        valid = ids != -1
+        if self.deleted_count > 0:
+            valid &= ~self._is_deleted[ids]
+
+        # cut each row down to its first top_k valid hits and compact the
+        # whole result matrix with one nonzero + gather
+        valid &= np.cumsum(valid, axis=1) <= top_k
+        rows, cols = np.nonzero(valid)
+        match_doc_ids = self._doc_ids[ids[rows, cols]]
+        match_scores = scores[rows, cols]
+
+        metric = self.metric
+        matches = None
+        prev_row = -1
+        for row, doc_id, score in zip(rows.tolist(), match_doc_ids, match_scores):
+            if row != prev_row:
+                matches = query_docs[row].matches
+                prev_row = row
+            match = Document(id=doc_id)
+            match.scores[metric] = score
+            matches.append(match)
+
+    def _faiss_search(self, vecs: 'np.ndarray', top_k: int):
+        """Run the faiss search with reusable output buffers.
+
+        ``Index.search(x, k)`` allocates fresh distance/label arrays on
+        every call; go through the C-level signature with ``swig_ptr``
+        instead, reallocating the buffers only when the batch shape
+        changes.
+        """
+        num_queries = vecs.shape[0]
+        if self._dists_buf is None or self._dists_buf.shape != (
+            num_queries,
+            top_k,
+        ):
+            self._dists_buf = np.empty((num_queries, top_k), dtype=np.float32)
+            self._ids_buf = np.empty((num_queries, top_k), dtype=np.int64)
+
+        self._faiss_index.search_c(
+            num_queries,
+            faiss.swig_ptr(vecs),
+            top_k,
+            faiss.swig_ptr(self._dists_buf),
+            faiss.swig_ptr(self._ids_buf),
+        )
+        return self._dists_buf, self._ids_buf
 
-        dists, ids = self._faiss_index.search(vecs, expand_topk)
+    def _compute_scores(self, dists: 'np.ndarray') -> 'np.ndarray':
+        """Convert the raw faiss distances into the emitted scores in a
+        single vectorized pass over the result matrix.
 
+        For ``inner_product`` faiss already returns similarities, which are
+        reinterpreted as distances when ``is_distance`` is set.
+        """
         if self.metric == 'inner_product':
-            dists = 1 - dists
-
-        for doc_idx, matches in enumerate(zip(ids, dists)):
-            count = 0
-            for m_info in zip(*matches):
-                idx, dist = m_info
-                doc_id = self._doc_ids[idx]
-
-                if self.is_deleted(idx):
-                    continue
-
-                match = Document(id=doc_id)
-                if self.is_distance:
-                    match.scores[self.metric] = dist
-                else:
-                    if self.metric == 'inner_product':
-                        match.scores[self.metric] = 1 - dist
-                    else:
-                        match.scores[self.metric] = 1 / (1 + dist)
-
-                query_docs[doc_idx].matches.append(match)
-
-                # early stop as topk results are ready
-                count += 1
-                if count >= top_k:
-                    break
+            return 1 - dists if self.is_distance else dists
+        return dists if self.is_distance else 1 / (1 + dists)
 
     @requests(on='/save')
     def save(self, target_path: Optional[str] = None, **kwargs):
@@ -373,22 +542,36 @@ class FaissSearcher(Executor):
         # dump faiss index
         faiss.write_index(self._faiss_index, os.path.join(target_path, 'faiss.bin'))
 
-        with open(os.path.join(target_path, 'doc_ids.bin'), "wb") as fp:
-            pickle.dump(self._doc_ids, fp)
-
-        with open(os.path.join(target_path, 'delete_marks.bin'), "wb") as fp:
-            pickle.dump(self._is_deleted, fp)
+        # plain .npy dumps are one fwrite/fread instead of one pickle
+        # reduce per element
+        np.save(os.path.join(target_path, 'doc_ids.npy'), self._doc_ids.astype(str))
+        np.save(os.path.join(target_path, 'delete_marks.npy'), self._is_deleted)
+
+    def _load_doc_ids(self, from_path: str) -> 'np.ndarray':
+        npy_path = os.path.join(from_path, 'doc_ids.npy')
+        if os.path.exists(npy_path):
+            return np.load(npy_path).astype(object)
+        # fall back to the legacy pickle snapshot format
+        with open(os.path.join(from_path, 'doc_ids.bin'), 'rb') as fp:
+            return np.array(pickle.load(fp), dtype=object)
+
+    def _load_delete_marks(self, from_path: str) -> 'np.ndarray':
+        npy_path = os.path.join(from_path, 'delete_marks.npy')
+        if os.path.exists(npy_path):
+            return np.load(npy_path)
+        # fall back to the legacy pickle snapshot format
+        with open(os.path.join(from_path, 'delete_marks.bin'), 'rb') as fp:
+            return np.asarray(pickle.load(fp), dtype=bool)
 
     def _load(self, from_path: Optional[str] = None):
         from_path = from_path if from_path else self.workspace
         self.logger.info(f'Try to load indexer from {from_path}...')
         try:
-            with open(os.path.join(from_path, 'doc_ids.bin'), 'rb') as fp:
-                self._doc_ids = pickle.load(fp)
-                self._doc_id_to_offset = {v: i for i, v in enumerate(self._doc_ids)}
+            self._doc_ids = self._load_doc_ids(from_path)
+            self._doc_id_to_offset = {v: i for i, v in enumerate(self._doc_ids)}
 
-            with open(os.path.join(from_path, 'delete_marks.bin'), 'rb') as fp:
-                self._is_deleted = pickle.load(fp)
+            self._is_deleted = self._load_delete_marks(from_path)
+            self._deleted_count = int(np.count_nonzero(self._is_deleted))
 
             index = faiss.read_index(os.path.join(from_path, 'faiss.bin'))
             assert index.metric_type == self.metric_type
@@ -396,6 +579,7 @@ class FaissSearcher(Executor):
             self.num_dim = index.d
             self._faiss_index = self.to_device(index)
             self._faiss_index.nprobe = self.nprobe
+            self._maybe_make_direct_map()
         except FileNotFoundError:
             self.logger.warning(
                 'None snapshot is found, you should build the indexer from scratch'
@@ -436,8 +620,6 @@ class FaissSearcher(Executor):
         self.num_dim = train_data.shape[1]
         self.dtype = train_data.dtype
 
-        train_data = train_data.astype(np.float32)
-
         self._init_faiss_index(self.num_dim)
 
         if max_num_training_points and max_num_training_points < train_data.shape[0]:
@@ -452,20 +634,34 @@ class FaissSearcher(Executor):
             )
             train_data = train_data[random_indices, :]
 
+        # materializes only the sampled subset when the source is mmapped
+        train_data = np.ascontiguousarray(train_data, dtype=np.float32)
+        if not train_data.flags.writeable:
+            # a float32 .npy source without subsampling passes the
+            # read-only mmap straight through; normalize_L2 writes in
+            # place, so force a writable copy
+            train_data = np.array(train_data)
+
         if self.normalize:
             faiss.normalize_L2(train_data)
         self._train(train_data)
 
         self.logger.info(f'Dumping the trained Faiss index to {trained_index_file}')
-        if self.on_gpu:
-            self._faiss_index = faiss.index_gpu_to_cpu(self._faiss_index)
+        # dump a cpu copy but keep the (possibly gpu-resident) live index
+        # untouched, so /train does not move subsequent /search calls to
+        # the cpu and does not force another slow cpu->gpu clone
+        cpu_index = (
+            faiss.index_gpu_to_cpu(self._faiss_index)
+            if self.on_gpu
+            else self._faiss_index
+        )
 
         if os.path.exists(trained_index_file):
             self.logger.warning(
                 f'We are going to overwrite the index file located at '
                 f'{trained_index_file}'
             )
-        faiss.write_index(self._faiss_index, trained_index_file)
+        faiss.write_index(cpu_index, trained_index_file)
 
     def _train(self, data: 'np.ndarray', *args, **kwargs) -> None:
         _num_samples, _num_dim = data.shape
@@ -489,7 +685,9 @@ class FaissSearcher(Executor):
         result = None
 
         try:
-            result = np.load(train_filepath)
+            # memory-map so only the rows actually used for training are
+            # paged in
+            result = np.load(train_filepath, mmap_mode='r')
             if isinstance(result, np.lib.npyio.NpzFile):
                 self.logger.warning(
                     '.npz format is not supported. Please save the array in .npy '
@@ -503,21 +701,6 @@ class FaissSearcher(Executor):
                 )
             )
 
-        if result is None:
-            try:
-                result = np.load(train_filepath)
-                if isinstance(result, np.lib.npyio.NpzFile):
-                    self.logger.warning(
-                        '.npz format is not supported. '
-                        'Please save the array in .npy format.'
-                    )
-                    result = None
-            except Exception as e:
-                self.logger.error(
-                    'Loading training data with np.load failed, filepath={}, '
-                    '{}'.format(train_filepath, e)
-                )
-
         if result is None:
             try:
                 # Read from binary file:
@@ -547,24 +730,40 @@ class FaissSearcher(Executor):
     def fill_embedding(self, docs: Optional[DocumentArray], **kwargs):
         if docs is None:
             return
+
+        found_docs = []
+        offsets = []
         for doc in docs:
-            if doc.id in self._doc_id_to_offset:
-                try:
-                    reconstruct_embedding = self._faiss_index.reconstruct(
-                        self._doc_id_to_offset[doc.id]
-                    )
-                    doc.embedding = np.array(reconstruct_embedding)
-                except RuntimeError as exception:
-                    self.logger.warning(
-                        f'Trying to reconstruct from '
-                        f'document id failed. Most '
-                        f'likely the index built '
-                        f'from index key {self.index_key} \
-                         does not support this '
-                        f'operation. {repr(exception)}'
-                    )
-            else:
+            offset = self._doc_id_to_offset.get(doc.id)
+            if offset is None:
                 self.logger.debug(f'Document {doc.id} not found in index')
+                continue
+            found_docs.append(doc)
+            offsets.append(offset)
+
+        if not offsets:
+            return
+
+        try:
+            if hasattr(self._faiss_index, 'reconstruct_batch'):
+                # one C-level call for all requested offsets
+                embeddings = self._faiss_index.reconstruct_batch(
+                    np.asarray(offsets, dtype=np.int64)
+                )
+                for doc, embedding in zip(found_docs, embeddings):
+                    doc.embedding = np.array(embedding)
+            else:
+                for doc, offset in zip(found_docs, offsets):
+                    doc.embedding = np.array(self._faiss_index.reconstruct(offset))
+        except RuntimeError as exception:
+            self.logger.warning(
+                f'Trying to reconstruct from '
+                f'document id failed. Most '
+                f'likely the index built '
+                f'from index key {self.index_key} \
+                 does not support this '
+                f'operation. {repr(exception)}'
+            )
 
     @property
     def size(self):
@@ -573,7 +772,7 @@ class FaissSearcher(Executor):
 
     @property
     def deleted_count(self):
-        return sum(self._is_deleted)
+        return self._deleted_count
 
     @property
     def metric_type(self):
@@ -590,39 +789,108 @@ class FaissSearcher(Executor):
         return metric_type
 
     def is_deleted(self, idx):
-        return self._is_deleted[idx]
+        return bool(self._is_deleted[idx])
+
+    @property
+    def _doc_ids(self) -> 'np.ndarray':
+        """View of the filled part of the doc id backing array"""
+        return self._doc_ids_buf[: self._num_docs]
+
+    @_doc_ids.setter
+    def _doc_ids(self, value: 'np.ndarray'):
+        self._doc_ids_buf = value
+        self._num_docs = len(value)
+
+    @property
+    def _is_deleted(self) -> 'np.ndarray':
+        """View of the filled part of the deletion mark backing array"""
+        return self._is_deleted_buf[: self._num_docs]
+
+    @_is_deleted.setter
+    def _is_deleted(self, value: 'np.ndarray'):
+        self._is_deleted_buf = value
+
+    def _add_doc_ids(self, doc_ids: List[str]):
+        offset = self._num_docs
+        self._doc_id_to_offset.update(
+            (doc_id, offset + i) for i, doc_id in enumerate(doc_ids)
+        )
+        num_new = len(doc_ids)
+        self._grow_backing_arrays(offset + num_new)
+        self._doc_ids_buf[offset : offset + num_new] = doc_ids
+        self._num_docs = offset + num_new
+
+    def _grow_backing_arrays(self, required: int):
+        """Double the capacity of the doc id / deletion mark backing
+        arrays when full, so appending a chunk is amortized O(1) instead
+        of one full re-allocation per chunk
+        """
+        capacity = len(self._doc_ids_buf)
+        if required <= capacity:
+            return
+        new_capacity = max(required, capacity * 2, 1024)
+
+        doc_ids = np.empty(new_capacity, dtype=object)
+        doc_ids[:capacity] = self._doc_ids_buf
+        self._doc_ids_buf = doc_ids
+
+        is_deleted = np.zeros(new_capacity, dtype=bool)
+        is_deleted[:capacity] = self._is_deleted_buf
+        self._is_deleted_buf = is_deleted
+
+    def _mark_deleted(self, idx: int):
+        if not self._is_deleted[idx]:
+            self._is_deleted[idx] = True
+            self._deleted_count += 1
 
     def _append_vecs_and_ids(self, doc_ids: List[str], vecs: np.ndarray):
         assert len(doc_ids) == vecs.shape[0]
-        for doc_id in doc_ids:
-            self._doc_id_to_offset[doc_id] = len(self._doc_ids)
-            self._doc_ids.append(doc_id)
-            self._is_deleted.append(0)
+        self._add_doc_ids(doc_ids)
         self._index(vecs)
 
     def _add_delta(self, delta: Generator[Tuple[str, bytes, datetime], None, None]):
         """
         Adding the delta data to the indexer
+
+        The new and updated vectors are accumulated up to ``prefetch_size``
+        items and flushed with a single bulk decode + faiss ``add`` instead
+        of one single-row ``add`` per doc.
+
         :param delta: a generator yielding (id, doc_vec_bytes, last_updated)
         """
+        batch_size = self.prefetch_size or 512
+        pending_ids = []
+        pending_buffers = []
+
+        # the delta rows carry the storage's dump dtype (float64 by
+        # default), not float32: decode with the dtype inferred when the
+        # dump was loaded, like _iterate_vectors_and_save_ids does
+        dtype = getattr(self, 'dtype', np.float64)
+
+        def _flush():
+            if not pending_ids:
+                return
+            vecs = np.frombuffer(
+                b''.join(pending_buffers), dtype=dtype
+            ).reshape(len(pending_ids), self.num_dim)
+            self._append_vecs_and_ids(list(pending_ids), vecs)
+            pending_ids.clear()
+            pending_buffers.clear()
+
         for doc_id, vec_buffer, _ in delta:
             idx = self._doc_id_to_offset.get(doc_id)
             if idx is None:  # add new item
                 if vec_buffer is None:
                     continue
-                vec = np.frombuffer(vec_buffer, dtype=np.float32).reshape(
-                    1, -1
-                )  # shape [1, D]
-
-                self._append_vecs_and_ids([doc_id], vec)
             elif vec_buffer is None:  # soft delete
-                self._is_deleted[idx] = 1
-            else:  # update
-                # first soft delete
-                self._is_deleted[idx] = 1
-
-                # then add the updated doc
-                vec = np.frombuffer(vec_buffer, dtype=np.float32).reshape(
-                    1, -1
-                )  # shape [1, D]
-                self._append_vecs_and_ids([doc_id], vec)
+                self._mark_deleted(idx)
+                continue
+            else:  # update: soft delete first, then re-add the new vector
+                self._mark_deleted(idx)
+
+            pending_ids.append(doc_id)
+            pending_buffers.append(vec_buffer)
+            if len(pending_ids) >= batch_size:
+                _flush()
+
+        _flush()
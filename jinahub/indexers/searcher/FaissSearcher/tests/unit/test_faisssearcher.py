@@ -2,6 +2,7 @@ __copyright__ = "Copyright (c) 2021 Jina AI Limited. All rights reserved."
 __license__ = "Apache-2.0"
 
 import os
+import pickle
 from pathlib import Path
 
 import numpy as np
@@ -501,8 +502,8 @@ def test_faiss_delta(metas, tmpdir):
 
     indexer._add_delta(_generate_add_delta())
     assert indexer.size == 6
-    assert indexer._is_deleted == [0, 0, 0, 0, 0, 0]
-    assert indexer._doc_ids == ['0', '1', '2', '3', '4', '5']
+    assert indexer._is_deleted.tolist() == [0, 0, 0, 0, 0, 0]
+    assert indexer._doc_ids.tolist() == ['0', '1', '2', '3', '4', '5']
 
     def _generate_delete_delta():
         for i in range(2, 4):
@@ -510,8 +511,8 @@ def test_faiss_delta(metas, tmpdir):
 
     indexer._add_delta(_generate_delete_delta())
     assert indexer.size == 4
-    assert indexer._is_deleted == [0, 0, 1, 1, 0, 0]
-    assert indexer._doc_ids == ['0', '1', '2', '3', '4', '5']
+    assert indexer._is_deleted.tolist() == [0, 0, 1, 1, 0, 0]
+    assert indexer._doc_ids.tolist() == ['0', '1', '2', '3', '4', '5']
 
     def _generate_update_delta():
         for i in range(4, 6):
@@ -520,8 +521,8 @@ def test_faiss_delta(metas, tmpdir):
 
     indexer._add_delta(_generate_update_delta())
     assert indexer.size == 4
-    assert indexer._is_deleted == [0, 0, 1, 1, 1, 1, 0, 0]
-    assert indexer._doc_ids == ['0', '1', '2', '3', '4', '5', '4', '5']
+    assert indexer._is_deleted.tolist() == [0, 0, 1, 1, 1, 1, 0, 0]
+    assert indexer._doc_ids.tolist() == ['0', '1', '2', '3', '4', '5', '4', '5']
 
     # update the deleted docs take the same effect of adding new items
     def _generate_update_delta():
@@ -531,8 +532,8 @@ def test_faiss_delta(metas, tmpdir):
 
     indexer._add_delta(_generate_update_delta())
     assert indexer.size == 6
-    assert indexer._is_deleted == [0, 0, 1, 1, 1, 1, 0, 0, 0, 0]
-    assert indexer._doc_ids == ['0', '1', '2', '3', '4', '5', '4', '5', '2', '3']
+    assert indexer._is_deleted.tolist() == [0, 0, 1, 1, 1, 1, 0, 0, 0, 0]
+    assert indexer._doc_ids.tolist() == ['0', '1', '2', '3', '4', '5', '4', '5', '2', '3']
 
     query = np.zeros((1, num_dims))
     query[0, 0] = 5
@@ -588,3 +589,62 @@ def test_faiss_save(metas, tmpdir):
     new_indexer.search(docs, parameters={'top_k': 2})
     dist = docs.traverse_flat(['m']).get_attributes('scores')
     assert dist[0]['l2'].value == 1.0
+
+
+def test_faiss_load_legacy_snapshot(metas, tmpdir):
+    num_data = 4
+    num_dims = 64
+
+    vecs = np.zeros((num_data, num_dims))
+    vecs[:, 0] = 2
+    vecs[0, 1] = 3
+    keys = np.arange(0, num_data).astype(str)
+
+    dump_path = os.path.join(tmpdir, 'dump')
+    export_dump_streaming(
+        dump_path,
+        1,
+        len(keys),
+        zip(keys, vecs, [b'' for _ in range(len(vecs))]),
+    )
+
+    indexer = FaissSearcher(
+        prefetch_size=256,
+        index_key='Flat',
+        normalize=True,
+        requires_training=True,
+        metas=metas,
+        dump_path=dump_path,
+        runtime_args={'pea_id': 0},
+    )
+
+    indexer.save()
+
+    # rewrite the snapshot in the old pickle format
+    workspace = indexer.workspace
+    os.remove(os.path.join(workspace, 'doc_ids.npy'))
+    os.remove(os.path.join(workspace, 'delete_marks.npy'))
+    delete_marks = [False, True, False, False]
+    with open(os.path.join(workspace, 'doc_ids.bin'), 'wb') as fp:
+        pickle.dump(np.array(keys, dtype=object), fp)
+    with open(os.path.join(workspace, 'delete_marks.bin'), 'wb') as fp:
+        pickle.dump(np.array(delete_marks), fp)
+
+    new_indexer = FaissSearcher(
+        prefetch_size=256,
+        index_key='Flat',
+        normalize=True,
+        requires_training=True,
+        metas=metas,
+        runtime_args={'pea_id': 0},
+    )
+
+    assert new_indexer._doc_ids.tolist() == keys.tolist()
+    assert new_indexer._is_deleted.tolist() == delete_marks
+    assert new_indexer.deleted_count == 1
+    assert new_indexer.size == 3
+
+    # saving again migrates the snapshot to the .npy format
+    new_indexer.save()
+    assert os.path.exists(os.path.join(workspace, 'doc_ids.npy'))
+    assert os.path.exists(os.path.join(workspace, 'delete_marks.npy'))
@@ -54,6 +54,7 @@ class FaissPostgresSearcher(Executor):
         self._kv_indexer = None
         self._vec_indexer = None
         self._init_kwargs = kwargs
+        self._last_sync_timestamp = None
 
         (
             self._kv_indexer,
@@ -79,24 +80,49 @@ class FaissPostgresSearcher(Executor):
     def sync(self, parameters: Optional[Dict], **kwargs):
         """
         Sync the data from the PSQLStorage into the FaissSearcher
+
+        Pass ``force_rebuild`` to re-import the full snapshot instead of
+        applying deltas: hard deletes and /cleanup leave no delta row, so
+        only a rebuild evicts those docs from the Faiss index
         """
         use_delta = parameters.get('use_delta', False)
         only_delta = parameters.get('only_delta', False)
+        force_rebuild = parameters.get('force_rebuild', False)
 
         if only_delta:
             self._sync_only_delta(parameters, **kwargs)
 
         else:
-            self._sync_snapshot(use_delta)
+            self._sync_snapshot(use_delta, force_rebuild)
 
-    def _sync_snapshot(self, use_delta):
+    def _sync_snapshot(self, use_delta, force_rebuild=False):
         self.logger.info('Syncing via snapshot...')
         if self.total_shards:
+            if (
+                not force_rebuild
+                and self._vec_indexer is not None
+                and self._last_sync_timestamp
+            ):
+                # the vectors up to the last sync are already indexed;
+                # apply only the rows changed since then instead of
+                # re-training and re-adding the whole snapshot
+                self.logger.info(
+                    f'Syncing delta since timestamp {self._last_sync_timestamp}'
+                )
+                deltas = self._kv_indexer._get_delta(
+                    shard_id=self.runtime_args.pea_id,
+                    total_shards=self.total_shards,
+                    timestamp=self._last_sync_timestamp,
+                )
+                self._vec_indexer._add_delta(self._track_last_timestamp(deltas))
+                return
+
             dump_func = functools.partial(
                 self._kv_indexer.get_snapshot, total_shards=self.total_shards
             )
             timestamp = self._kv_indexer.last_snapshot_timestamp
             self._vec_indexer = FaissSearcher(dump_func=dump_func, **self._init_kwargs)
+            self._last_sync_timestamp = timestamp
 
             if use_delta:
                 self.logger.info(f'Now adding delta from timestamp {timestamp}')
@@ -107,13 +133,25 @@ class FaissPostgresSearcher(Executor):
                     timestamp=timestamp,
                 )
                 # deltas will be like DOC_ID, OPERATION, DATA
-                self._vec_indexer._add_delta(deltas)
+                self._vec_indexer._add_delta(self._track_last_timestamp(deltas))
         else:
             self.logger.warning(
                 'total_shards is None, rolling update '
                 'via PSQL import will not be possible.'
             )
 
+    def _track_last_timestamp(self, deltas):
+        """Pass the delta rows through while remembering the highest
+        ``last_updated`` timestamp, so the next sync can start from there
+        """
+        for doc_id, vec_buffer, last_updated in deltas:
+            if last_updated is not None and (
+                self._last_sync_timestamp is None
+                or last_updated > self._last_sync_timestamp
+            ):
+                self._last_sync_timestamp = last_updated
+            yield doc_id, vec_buffer, last_updated
+
     def _sync_only_delta(self, parameters, **kwargs):
         timestamp = parameters.get('timestamp', None)
         startup = parameters.get('startup', False)
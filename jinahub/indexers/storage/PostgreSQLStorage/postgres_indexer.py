@@ -1,19 +1,18 @@
 __copyright__ = "Copyright (c) 2021 Jina AI Limited. All rights reserved."
 __license__ = "Apache-2.0"
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
 
-from jina import Document, DocumentArray, Executor, requests
-from jina_commons import get_logger
+from jina import DocumentArray, Executor, requests
+from jina.logging.logger import JinaLogger
 from jina_commons.indexers.dump import export_dump_streaming
 
-from .postgreshandler import PostgreSQLHandler
+from .postgreshandler import PostgreSQLHandler, doc_without_embedding  # noqa: F401
 
-
-def doc_without_embedding(d: Document):
-    new_doc = Document(d, copy=True)
-    new_doc.ClearField('embedding')
-    return new_doc.SerializeToString()
+# shared by all instances: the executor is constructed once per
+# shard/replica, so the logger setup need not be repeated per instance
+_LOGGER = JinaLogger('PostgreSQLStorage')
 
 
 class PostgreSQLStorage(Executor):
@@ -31,6 +30,12 @@ class PostgreSQLStorage(Executor):
     :param dry_run: If True, no database connection will be build.
     :param virtual_shards: the number of shards to distribute
      the data (used when rolling update on Searcher side)
+    :param session_settings: server settings to SET per connection,
+     e.g. ``{'io_method': 'io_uring', 'effective_io_concurrency': '256'}``
+     on PostgreSQL 18+. Settings the server rejects are skipped.
+    :param synchronous_commit: whether ingest transactions wait for the
+     WAL flush. Off by default, since the storage can be re-indexed from
+     upstream; set to True when strict durability is required.
     :param args: other arguments
     :param kwargs: other keyword arguments
     """
@@ -48,6 +53,8 @@ class PostgreSQLStorage(Executor):
         default_return_embeddings: bool = True,
         dry_run: bool = False,
         virtual_shards: int = 128,
+        session_settings: Optional[Dict] = None,
+        synchronous_commit: bool = False,
         *args,
         **kwargs,
     ):
@@ -59,7 +66,7 @@ class PostgreSQLStorage(Executor):
         self.password = password
         self.database = database
         self.table = table
-        self.logger = get_logger(self)
+        self.logger = _LOGGER
         self.virtual_shards = virtual_shards
         self.handler = PostgreSQLHandler(
             hostname=self.hostname,
@@ -71,6 +78,8 @@ class PostgreSQLStorage(Executor):
             max_connections=max_connections,
             dry_run=dry_run,
             virtual_shards=virtual_shards,
+            session_settings=session_settings,
+            synchronous_commit=synchronous_commit,
         )
         self.default_return_embeddings = default_return_embeddings
 
@@ -96,6 +105,19 @@ class PostgreSQLStorage(Executor):
         with self.handler as postgres_handler:
             return postgres_handler.get_snapshot_size()
 
+    def _flat(self, docs: DocumentArray, parameters: Dict) -> DocumentArray:
+        """Flatten ``docs`` along the traversal paths of the request.
+
+        The root-only default skips the traversal walk (and its
+        DocumentArray allocation) entirely.
+        """
+        traversal_paths = parameters.get(
+            'traversal_paths', self.default_traversal_paths
+        )
+        if traversal_paths == ['r']:
+            return docs
+        return docs.traverse_flat(traversal_paths)
+
     @requests(on='/index')
     def add(self, docs: DocumentArray, parameters: Dict, **kwargs):
         """Add Documents to Postgres
@@ -105,11 +127,11 @@ class PostgreSQLStorage(Executor):
         """
         if docs is None:
             return
-        traversal_paths = parameters.get(
-            'traversal_paths', self.default_traversal_paths
-        )
+        flat_docs = self._flat(docs, parameters)
+        if not flat_docs:
+            return
         with self.handler as postgres_handler:
-            postgres_handler.add(docs.traverse_flat(traversal_paths))
+            postgres_handler.add(flat_docs)
 
     @requests(on='/update')
     def update(self, docs: DocumentArray, parameters: Dict, **kwargs):
@@ -120,11 +142,11 @@ class PostgreSQLStorage(Executor):
         """
         if docs is None:
             return
-        traversal_paths = parameters.get(
-            'traversal_paths', self.default_traversal_paths
-        )
+        flat_docs = self._flat(docs, parameters)
+        if not flat_docs:
+            return
         with self.handler as postgres_handler:
-            postgres_handler.update(docs.traverse_flat(traversal_paths))
+            postgres_handler.update(flat_docs)
 
     @requests(on='/delete')
     def cleanup(self, **kwargs):
@@ -149,12 +171,12 @@ class PostgreSQLStorage(Executor):
         """
         if docs is None:
             return
-        traversal_paths = parameters.get(
-            'traversal_paths', self.default_traversal_paths
-        )
         soft_delete = parameters.get('soft_delete', False)
+        flat_docs = self._flat(docs, parameters)
+        if not flat_docs:
+            return
         with self.handler as postgres_handler:
-            postgres_handler.delete(docs.traverse_flat(traversal_paths), soft_delete)
+            postgres_handler.delete(flat_docs, soft_delete)
 
     @requests(on='/dump')
     def dump(self, parameters: Dict, **kwargs):
@@ -165,10 +187,13 @@ class PostgreSQLStorage(Executor):
         path = parameters.get('dump_path')
         if path is None:
             self.logger.error(f'No "dump_path" provided for {self}')
+            return
 
-        shards = int(parameters.get('shards'))
+        shards = parameters.get('shards')
         if shards is None:
             self.logger.error(f'No "shards" provided for {self}')
+            return
+        shards = int(shards)
 
         include_metas = parameters.get('include_metas', True)
 
@@ -176,7 +201,8 @@ class PostgreSQLStorage(Executor):
             export_dump_streaming(
                 path,
                 shards=shards,
-                size=self.size,
+                # query the size on the already checked-out connection
+                size=postgres_handler.get_size(),
                 data=postgres_handler.get_generator(include_metas=include_metas),
             )
 
@@ -197,13 +223,12 @@ class PostgreSQLStorage(Executor):
         """
         if docs is None:
             return
-        traversal_paths = parameters.get(
-            'traversal_paths', self.default_traversal_paths
-        )
-
+        flat_docs = self._flat(docs, parameters)
+        if not flat_docs:
+            return
         with self.handler as postgres_handler:
             postgres_handler.search(
-                docs.traverse_flat(traversal_paths),
+                flat_docs,
                 return_embeddings=parameters.get(
                     'return_embeddings', self.default_return_embeddings
                 ),
@@ -228,30 +253,36 @@ class PostgreSQLStorage(Executor):
             shard_id, total_shards, self.virtual_shards
         )
 
-        with self.handler as postgres_handler:
-            return postgres_handler.get_snapshot(shards_to_get)
+        # the generator manages its own pooled connection, so it stays
+        # consumable after this call returns
+        return self.handler.get_snapshot(shards_to_get)
 
     @staticmethod
     def _vshards_to_get(shard_id, total_shards, virtual_shards):
-        if shard_id > total_shards - 1:
+        # the arguments are fixed per deployment, so the virtual shard
+        # assignment is computed once and served from the cache afterwards
+        return list(
+            PostgreSQLStorage._cached_vshards_to_get(
+                shard_id, total_shards, virtual_shards
+            )
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _cached_vshards_to_get(shard_id, total_shards, virtual_shards):
+        if not 0 <= shard_id < total_shards:
             raise ValueError(
                 'shard_id should be 0-indexed out ' 'of range(total_shards)'
             )
-        vshards = list(range(virtual_shards))
         vshard_part = (
             virtual_shards // total_shards
         )  # nr of virtual shards given to one shard
-        vshard_remainder = virtual_shards % total_shards
+        start = shard_id * vshard_part
+        end = start + vshard_part
         if shard_id == total_shards - 1:
-            shards_to_get = vshards[
-                shard_id
-                * vshard_part : ((shard_id + 1) * vshard_part + vshard_remainder)
-            ]
-        else:
-            shards_to_get = vshards[
-                shard_id * vshard_part : (shard_id + 1) * vshard_part
-            ]
-        return [str(shard_id) for shard_id in shards_to_get]
+            # the last shard takes the remainder
+            end += virtual_shards % total_shards
+        return tuple(str(shard) for shard in range(start, end))
 
     def _get_delta(self, shard_id, total_shards, timestamp):
         """
@@ -3,6 +3,10 @@ __license__ = "Apache-2.0"
 
 import datetime
 import hashlib
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from typing import Generator, List, Optional, Tuple
 
 import numpy as np
@@ -14,14 +18,37 @@ from psycopg2 import pool  # noqa: F401
 
 
 def doc_without_embedding(d: Document):
-    new_doc = Document(d, copy=True)
-    new_doc.ClearField('embedding')
-    return new_doc.SerializeToString()
+    # clear the embedding in place and restore it afterwards, instead of
+    # deep-copying the whole Document just to drop one field
+    proto = d.proto
+    if not proto.HasField('embedding'):
+        return proto.SerializeToString()
+    embedding = proto.embedding.SerializeToString()
+    proto.ClearField('embedding')
+    try:
+        return proto.SerializeToString()
+    finally:
+        proto.embedding.ParseFromString(embedding)
 
 
 SCHEMA_VERSION = 2
 SCHEMA_VERSIONS_TABLE_NAME = 'schema_versions'
 
+# signature + flags + header extension length of the binary COPY format
+COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+COPY_BINARY_TRAILER = struct.pack('!h', -1)
+
+
+class _TrackedConnection(psycopg2.extensions.connection):
+    """Pooled connection that remembers which per-session setup (session
+    settings, prepared statements) has already run on it. The pool may
+    close and replace connections, so the state has to live on the
+    connection object itself.
+    """
+
+    session_settings_applied = False
+    statements_prepared = False
+
 
 class PostgreSQLHandler:
     """
@@ -37,6 +64,14 @@ class PostgreSQLHandler:
     :param dry_run: If True, no database connection will be build
     :param virtual_shards: the number of shards to
     distribute the data (used when rolling update on Searcher side)
+    :param session_settings: server settings to SET on every pooled
+    connection, e.g. ``{'effective_io_concurrency': '256'}``. Settings
+    the server does not know (e.g. ``io_method`` before PostgreSQL 18)
+    are skipped with a warning
+    :param synchronous_commit: whether to wait for the WAL flush on every
+    ingest transaction. Off by default: the index can be re-built from
+    upstream, so losing the last moments before an OS crash is acceptable
+    in exchange for taking the fsync off the critical path
     :param args: other arguments
     :param kwargs: other keyword arguments
     """
@@ -53,6 +88,8 @@ class PostgreSQLHandler:
         dump_dtype: type = np.float64,
         dry_run: bool = False,
         virtual_shards: int = 128,
+        session_settings: Optional[dict] = None,
+        synchronous_commit: bool = False,
         *args,
         **kwargs,
     ):
@@ -62,9 +99,25 @@ class PostgreSQLHandler:
         self.dump_dtype = dump_dtype
         self.virtual_shards = virtual_shards
         self.snapshot_table = 'snapshot'
+        self.session_settings = session_settings
+        self.synchronous_commit = synchronous_commit
+        self._connection_local = threading.local()
+        # reused across add() calls; threads are only spawned on first use
+        self._serializer_pool = ThreadPoolExecutor()
+
+        # hot statements, formatted once instead of on every request
+        self._sql_copy_add = (
+            f'COPY {self.table} (doc_id, embedding, doc, shard) '
+            f'FROM STDIN WITH (FORMAT BINARY)'
+        )
+        self._sql_search_emb = 'EXECUTE ps_search_emb(%s);'
+        self._sql_search_meta = 'EXECUTE ps_search_meta(%s);'
+        self._sql_get_size = f'SELECT COUNT(*) FROM {self.table}'
 
         if not dry_run:
-            self.postgreSQL_pool = psycopg2.pool.SimpleConnectionPool(
+            # thread-safe pool, so concurrent requests served from
+            # different threads do not serialize behind one connection
+            self.postgreSQL_pool = psycopg2.pool.ThreadedConnectionPool(
                 1,
                 max_connections,
                 user=username,
@@ -72,16 +125,32 @@ class PostgreSQLHandler:
                 database=database,
                 host=hostname,
                 port=port,
+                connection_factory=_TrackedConnection,
             )
             self._init_table()
 
+    @property
+    def connection(self):
+        """The pool connection checked out by the current thread"""
+        return getattr(self._connection_local, 'connection', None)
+
     def __enter__(self):
-        self.connection = self._get_connection()
+        # reentrant per thread: nested ``with`` blocks (or back-to-back
+        # calls inside one request) reuse the already-acquired connection
+        # instead of going through the pool again
+        depth = getattr(self._connection_local, 'depth', 0)
+        if depth == 0:
+            self._connection_local.connection = self._get_connection()
+        self._connection_local.depth = depth + 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.connection:
-            self._close_connection(self.connection)
+        self._connection_local.depth -= 1
+        if self._connection_local.depth == 0:
+            connection = self._connection_local.connection
+            self._connection_local.connection = None
+            if connection:
+                self._close_connection(connection)
 
     def _init_table(self):
         """
@@ -169,6 +238,39 @@ class PostgreSQLHandler:
                 f'Please migrate your data to the latest version.'
             )
 
+    def _embeddings_to_bytes(self, docs: DocumentArray) -> List[Optional[bytes]]:
+        """Pack the embeddings of ``docs`` into one ``bytea`` buffer per doc.
+
+        When every doc carries an embedding of the same shape, the whole
+        block is cast and serialized with a single ``tobytes`` call and
+        the rows handed out as zero-copy ``memoryview`` slices of that
+        one buffer, instead of one cast + allocation per doc.
+
+        :param docs: list of Documents
+        :return: the per-doc embedding buffers, ``None`` where a doc has
+            no embedding
+        """
+        try:
+            embeddings = np.stack(docs.get_attributes('embedding'))
+        except (ValueError, TypeError):
+            embeddings = None
+
+        if embeddings is None or embeddings.ndim != 2:
+            return [
+                doc.embedding.astype(self.dump_dtype).tobytes()
+                if doc.embedding is not None
+                else None
+                for doc in docs
+            ]
+
+        embeddings = embeddings.astype(self.dump_dtype, copy=False)
+        view = memoryview(embeddings.tobytes())
+        stride = embeddings.shape[1] * embeddings.dtype.itemsize
+        return [
+            view[row * stride : (row + 1) * stride]
+            for row in range(embeddings.shape[0])
+        ]
+
     def add(self, docs: DocumentArray, *args, **kwargs):
         """Insert the documents into the database.
 
@@ -181,22 +283,15 @@ class PostgreSQLHandler:
         """
         cursor = self.connection.cursor()
         try:
-            psycopg2.extras.execute_batch(
-                cursor,
-                f'INSERT INTO {self.table} '
-                f'(doc_id, embedding, doc, shard, last_updated) '
-                f'VALUES (%s, %s, %s, %s, current_timestamp)',
-                [
-                    (
-                        doc.id,
-                        doc.embedding.astype(self.dump_dtype).tobytes()
-                        if doc.embedding is not None
-                        else None,
-                        doc_without_embedding(doc),
-                        self._get_next_shard(doc.id),
-                    )
-                    for doc in docs
-                ],
+            if not self.synchronous_commit:
+                # let commit return before the WAL flush hits disk: the
+                # fsync leaves the critical path of the ingest transaction
+                cursor.execute('SET LOCAL synchronous_commit = off')
+            # binary COPY: one stream for the whole batch, with the bytea
+            # payloads sent raw instead of hex-encoded by the text protocol
+            cursor.copy_expert(
+                self._sql_copy_add,
+                self._docs_to_copy_stream(docs),
             )
         except psycopg2.errors.UniqueViolation as e:
             self.logger.warning(
@@ -206,6 +301,43 @@ class PostgreSQLHandler:
             self.connection.rollback()
         self.connection.commit()
 
+    def _docs_to_copy_stream(self, docs: DocumentArray) -> BytesIO:
+        """Serialize ``docs`` into PostgreSQL's binary COPY format.
+
+        ``last_updated`` is left to its ``current_timestamp`` column
+        default. Each field is length-prefixed raw bytes; ``-1`` marks
+        a NULL embedding.
+
+        :param docs: list of Documents
+        :return: the COPY payload, positioned at the start
+        """
+        if len(docs) > 64:
+            # protobuf's SerializeToString releases the GIL in the C++
+            # extension, so the per-doc serialization scales over threads
+            metas = list(self._serializer_pool.map(doc_without_embedding, docs))
+        else:
+            metas = [doc_without_embedding(doc) for doc in docs]
+
+        buffer = BytesIO()
+        buffer.write(COPY_BINARY_HEADER)
+        for doc, embedding, meta in zip(
+            docs, self._embeddings_to_bytes(docs), metas
+        ):
+            doc_id = doc.id.encode('utf-8')
+            buffer.write(struct.pack('!hi', 4, len(doc_id)))
+            buffer.write(doc_id)
+            if embedding is None:
+                buffer.write(struct.pack('!i', -1))
+            else:
+                buffer.write(struct.pack('!i', len(embedding)))
+                buffer.write(embedding)
+            buffer.write(struct.pack('!i', len(meta)))
+            buffer.write(meta)
+            buffer.write(struct.pack('!ii', 4, self._get_next_shard(doc.id)))
+        buffer.write(COPY_BINARY_TRAILER)
+        buffer.seek(0)
+        return buffer
+
     def update(self, docs: DocumentArray, *args, **kwargs):
         """Updated documents from the database.
 
@@ -217,18 +349,14 @@ class PostgreSQLHandler:
         cursor = self.connection.cursor()
         psycopg2.extras.execute_batch(
             cursor,
-            f'UPDATE {self.table}\
-             SET embedding = %s,\
-             doc = %s,\
-             last_updated = current_timestamp \
-            WHERE doc_id = %s',
+            'EXECUTE ps_update(%s, %s, %s)',
             [
                 (
-                    doc.embedding.astype(self.dump_dtype).tobytes(),
+                    embedding,
                     doc_without_embedding(doc),
                     doc.id,
                 )
-                for doc in docs
+                for doc, embedding in zip(docs, self._embeddings_to_bytes(docs))
             ],
         )
         self.connection.commit()
@@ -268,40 +396,36 @@ class PostgreSQLHandler:
             )
             psycopg2.extras.execute_batch(
                 cursor,
-                f'UPDATE {self.table} '
-                f'SET embedding = NULL, '
-                f'doc = NULL, '
-                f'last_updated = current_timestamp '
-                f'WHERE doc_id = %s;',
+                'EXECUTE ps_soft_delete(%s)',
                 [(doc.id,) for doc in docs],
             )
         else:
             psycopg2.extras.execute_batch(
                 cursor,
-                f'DELETE FROM {self.table} WHERE doc_id = %s;',
+                'EXECUTE ps_delete(%s)',
                 [(doc.id,) for doc in docs],
             )
         self.connection.commit()
         return
 
     def close(self):
+        self._serializer_pool.shutdown()
         self.postgreSQL_pool.closeall()
 
     def search(self, docs: DocumentArray, return_embeddings: bool = True, **kwargs):
         """Use the Postgres db as a key-value engine,
         returning the metadata of a document id"""
-        if return_embeddings:
-            embeddings_field = ', embedding '
-        else:
-            embeddings_field = ''
+        statement = (
+            self._sql_search_emb if return_embeddings else self._sql_search_meta
+        )
         cursor = self.connection.cursor()
+        # one roundtrip for the whole batch instead of one SELECT per doc
+        cursor.execute(statement, ([doc.id for doc in docs],))
+        results = {rec[0]: rec[1:] for rec in cursor.fetchall()}
         for doc in docs:
-            # retrieve metadata
-            cursor.execute(
-                f'SELECT doc {embeddings_field} FROM {self.table} WHERE doc_id = %s;',
-                (doc.id,),
-            )
-            result = cursor.fetchone()
+            result = results.get(doc.id)
+            if result is None:
+                continue
             data = bytes(result[0])
             retrieved_doc = Document(data)
             if return_embeddings and result[1] is not None:
@@ -319,11 +443,75 @@ class PostgreSQLHandler:
         # and maintain ACID-ity
         connection = self.postgreSQL_pool.getconn()
         connection.autocommit = False
+        self._apply_session_settings(connection)
+        self._prepare_statements(connection)
         return connection
 
+    def _prepare_statements(self, connection):
+        """PREPARE the hot search/update/delete statements once per pooled
+        connection, so repeated requests skip the parse/plan cycle and only
+        ship EXECUTE with the parameters.
+        """
+        if connection.statements_prepared:
+            return
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f'''PREPARE ps_search_emb(varchar[]) AS
+                    SELECT doc_id, doc, embedding FROM {self.table}
+                    WHERE doc_id = ANY($1);
+                PREPARE ps_search_meta(varchar[]) AS
+                    SELECT doc_id, doc FROM {self.table}
+                    WHERE doc_id = ANY($1);
+                PREPARE ps_update(bytea, bytea, varchar) AS
+                    UPDATE {self.table}
+                    SET embedding = $1, doc = $2,
+                    last_updated = current_timestamp
+                    WHERE doc_id = $3;
+                PREPARE ps_soft_delete(varchar) AS
+                    UPDATE {self.table}
+                    SET embedding = NULL, doc = NULL,
+                    last_updated = current_timestamp
+                    WHERE doc_id = $1;
+                PREPARE ps_delete(varchar) AS
+                    DELETE FROM {self.table} WHERE doc_id = $1;'''
+            )
+        except psycopg2.Error:
+            # the table may not exist yet (first checkout happens while
+            # _init_table runs); retry on the next checkout
+            connection.rollback()
+            return
+        connection.commit()
+        connection.statements_prepared = True
+
+    def _apply_session_settings(self, connection):
+        """Apply the configured server settings once per pooled connection.
+
+        Settings rejected by the server (unknown or out of range, e.g.
+        PostgreSQL 18 I/O settings on an older server) are skipped with
+        a warning instead of failing the request.
+        """
+        if not self.session_settings:
+            return
+        if connection.session_settings_applied:
+            return
+        cursor = connection.cursor()
+        for setting, value in self.session_settings.items():
+            try:
+                cursor.execute(f'SET {setting} = %s', (str(value),))
+            except psycopg2.Error as error:
+                self.logger.warning(
+                    f'Could not apply session setting '
+                    f'{setting}={value}: {error}'
+                )
+                connection.rollback()
+            else:
+                connection.commit()
+        connection.session_settings_applied = True
+
     def get_size(self):
         cursor = self.connection.cursor()
-        cursor.execute(f'SELECT COUNT(*) FROM {self.table}')
+        cursor.execute(self._sql_get_size)
         records = cursor.fetchall()
         return records[0][0]
 
@@ -353,9 +541,12 @@ class PostgreSQLHandler:
         """
         Get the data from the snapshot, for a specific range of virtual shards
         """
+        # a generator: acquire a dedicated connection so the rows can be
+        # consumed after the caller's handler context has exited
+        connection = self._get_connection()
         shards_quoted = tuple(int(shard) for shard in shards_to_get)
         try:
-            cursor = self.connection.cursor('snapshot')
+            cursor = connection.cursor('snapshot')
             cursor.itersize = 10000
             cursor.execute(
                 f'SELECT doc_id, embedding from {self.snapshot_table} '
@@ -365,34 +556,42 @@ class PostgreSQLHandler:
             )
             for rec in cursor:
                 yield rec[0], rec[1]
+            connection.commit()
         except (Exception, psycopg2.Error) as error:
             self.logger.error(f'Error importing snapshot: {error}')
-            self.connection.rollback()
-        self.connection.commit()
+            connection.rollback()
+        finally:
+            self._close_connection(connection)
 
     def get_generator(
         self, include_metas=True
     ) -> Generator[Tuple[str, bytes, Optional[bytes]], None, None]:
         connection = self._get_connection()
-        cursor = connection.cursor('generator')  # server-side cursor
-        cursor.itersize = 10000
-        if include_metas:
-            cursor.execute(
-                f'SELECT doc_id, embedding, doc FROM {self.table} ORDER BY doc_id'
-            )
-            for rec in cursor:
-                yield rec[0], np.frombuffer(rec[1]) if rec[
-                    1
-                ] is not None else None, rec[2]
-        else:
-            cursor.execute(
-                f'SELECT doc_id, embedding FROM {self.table} ORDER BY doc_id'
-            )
-            for rec in cursor:
-                yield rec[0], np.frombuffer(rec[1]) if rec[
-                    1
-                ] is not None else None, None
-        self._close_connection(connection)
+        try:
+            # named cursor: the server streams the result set in
+            # ``itersize`` batches instead of materializing it in libpq
+            cursor = connection.cursor('generator')
+            cursor.itersize = 10000
+            if include_metas:
+                cursor.execute(
+                    f'SELECT doc_id, embedding, doc FROM {self.table} '
+                    f'ORDER BY doc_id'
+                )
+                for doc_id, embedding, doc in cursor:
+                    yield doc_id, np.frombuffer(
+                        embedding
+                    ) if embedding is not None else None, doc
+            else:
+                cursor.execute(
+                    f'SELECT doc_id, embedding FROM {self.table} ORDER BY doc_id'
+                )
+                for doc_id, embedding in cursor:
+                    yield doc_id, np.frombuffer(
+                        embedding
+                    ) if embedding is not None else None, None
+        finally:
+            # return the connection even when the consumer stops early
+            self._close_connection(connection)
 
     def _get_snapshot_timestamp(self):
         """Get the timestamp of the snapshot"""
@@ -409,20 +608,22 @@ class PostgreSQLHandler:
         self, shards_to_get, timestamp
     ) -> Generator[Tuple[str, bytes, datetime.datetime], None, None]:
         connection = self._get_connection()
-        cursor = connection.cursor('generator')  # server-side cursor
-        cursor.itersize = 10000
-        shards_quoted = tuple(int(shard) for shard in shards_to_get)
-        cursor.execute(
-            f'SELECT doc_id, embedding, last_updated '
-            f'from {self.table} '
-            f'WHERE shard in %s '
-            f'and last_updated > %s '
-            f'ORDER BY doc_id',
-            (shards_quoted, timestamp),
-        )
-        for rec in cursor:
-            yield rec[0], rec[1], rec[2]
-        self._close_connection(connection)
+        try:
+            cursor = connection.cursor('generator')  # server-side cursor
+            cursor.itersize = 10000
+            shards_quoted = tuple(int(shard) for shard in shards_to_get)
+            cursor.execute(
+                f'SELECT doc_id, embedding, last_updated '
+                f'from {self.table} '
+                f'WHERE shard in %s '
+                f'and last_updated > %s '
+                f'ORDER BY doc_id',
+                (shards_quoted, timestamp),
+            )
+            for rec in cursor:
+                yield rec[0], rec[1], rec[2]
+        finally:
+            self._close_connection(connection)
 
     def get_snapshot_size(self):
         try:
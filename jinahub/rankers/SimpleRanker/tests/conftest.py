@@ -1,50 +1,56 @@
-import random
+import numpy as np
 import pytest
 
 from jina import DocumentArray, Document
 
 
-@pytest.fixture
-def documents_chunk():
-    document_array = DocumentArray()
-    document = Document(tags={'query_size': 35, 'query_price': 31, 'query_brand': 1})
-    for i in range(0, 10):
-        chunk = Document()
-        for j in range(0, 10):
-            match = Document(
-                tags={
-                    'level': 'chunk',
-                }
-            )
-            match.scores['cosine'] = random.random()
-            match.parent_id = i
-            chunk.matches.append(match)
-        document.chunks.append(chunk)
+def _chunk_with_matches(scores, parent_id):
+    chunk = Document()
+    matches = []
+    for score in scores:
+        match = Document(tags={'level': 'chunk'})
+        match.scores['cosine'] = float(score)
+        match.parent_id = parent_id
+        matches.append(match)
+    chunk.matches.extend(matches)
+    return chunk
 
-    document_array.extend([document])
-    return document_array
 
+def _copy(document_array):
+    # the ranker writes its aggregated matches onto these docs, so every
+    # test gets its own copy of the session-scoped template
+    return DocumentArray([Document(d, copy=True) for d in document_array])
 
-@pytest.fixture
-def documents_chunk_chunk():
-    document_array = DocumentArray()
+
+@pytest.fixture(scope='session')
+def _documents_chunk_template():
+    # seeded, so the scores are identical across tests and runs
+    scores = np.random.default_rng(0).random((10, 10))
+    document = Document(tags={'query_size': 35, 'query_price': 31, 'query_brand': 1})
+    document.chunks.extend(
+        _chunk_with_matches(scores[i], parent_id=i) for i in range(10)
+    )
+    return DocumentArray([document])
+
+
+@pytest.fixture(scope='session')
+def _documents_chunk_chunk_template():
+    scores = np.random.default_rng(0).random((10, 10, 10))
     document = Document(tags={'query_size': 35, 'query_price': 31, 'query_brand': 1})
-    for i in range(0, 10):
+    for i in range(10):
         chunk = Document()
-        for j in range(0, 10):
-            chunk_chunk = Document()
-            for k in range(0, 10):
-
-                match = Document(
-                    tags={
-                        'level': 'chunk',
-                    }
-                )
-                match.scores['cosine'] = random.random()
-                match.parent_id = j
-                chunk_chunk.matches.append(match)
-            chunk.chunks.append(chunk_chunk)
+        chunk.chunks.extend(
+            _chunk_with_matches(scores[i, j], parent_id=j) for j in range(10)
+        )
         document.chunks.append(chunk)
+    return DocumentArray([document])
 
-    document_array.extend([document])
-    return document_array
+
+@pytest.fixture
+def documents_chunk(_documents_chunk_template):
+    return _copy(_documents_chunk_template)
+
+
+@pytest.fixture
+def documents_chunk_chunk(_documents_chunk_chunk_template):
+    return _copy(_documents_chunk_chunk_template)